@@ -76,7 +76,7 @@ cmd_restore() {
     local backup_path
     if [ -f "${backup_file}" ]; then
         backup_path="${backup_file}"
-    elif [ -f "${BACKUP_DIR}/${backup_file}" ]; then
+    elif [[ "${backup_file}" != */* ]] && [ -f "${BACKUP_DIR}/${backup_file}" ]; then
         backup_path="${BACKUP_DIR}/${backup_file}"
     else
         print_error "Backup file not found: ${backup_file}"
@@ -84,10 +84,11 @@ cmd_restore() {
     fi
     
     # Extract world name from backup filename (format: backup_WORLDNAME_YYYYMMDD_HHMMSS.tar.gz)
-    local backup_basename
-    backup_basename=$(basename "${backup_path}")
-    local world_name
-    world_name=$(echo "${backup_basename}" | sed 's/^backup_\(.*\)_[0-9]*_[0-9]*.tar.*/\1/')
+    local backup_basename="${backup_path##*/}"
+    local world_name="${backup_basename}"
+    if [[ "${backup_basename}" =~ ${BACKUP_NAME_RE} ]]; then
+        world_name="${BASH_REMATCH[1]}"
+    fi
     
     # Show backup info
     echo ""
@@ -244,27 +245,25 @@ cmd_backups() {
     printf "%-50s %-12s %-20s\n" "BACKUP FILE" "SIZE" "CREATED"
     printf "%s\n" "--------------------------------------------------------------------------------"
     
-    for backup in $(ls -t "${BACKUP_DIR}"/backup_*.tar* 2>/dev/null); do
-        if [ -f "$backup" ]; then
-            local name
-            name=$(basename "$backup")
-            local size
-            size=$(du -h "$backup" 2>/dev/null | cut -f1)
-            local created
-            created=$(stat -c '%Y' "$backup" 2>/dev/null)
-            local created_date
-            created_date=$(date -d "@${created}" '+%Y-%m-%d %H:%M' 2>/dev/null || echo "Unknown")
-            
-            printf "%-50s %-12s %-20s\n" "$name" "$size" "$created_date"
-            ((count++))
-        fi
-    done
+    # One find pass yields every field; rows come back newest first with the
+    # size column already human-readable, so the loop only prints
+    local created size_bytes size name created_date
+    while IFS=$'\t' read -r created size_bytes size name; do
+        printf -v created_date '%(%Y-%m-%d %H:%M)T' "${created%.*}"
+        
+        printf "%-50s %-12s %-20s\n" "$name" "$size" "$created_date"
+        ((count++)) || true
+        ((total_size += size_bytes)) || true
+    done < <(find -L "${BACKUP_DIR}" -maxdepth 1 -type f -name 'backup_*.tar*' \
+                 -printf '%T@\t%s\t%k\t%f\n' 2>/dev/null | \
+             sort -rn | \
+             numfmt --delimiter=$'\t' --field=3 --from-unit=1024 --to=iec 2>/dev/null)
     
     if [ ${count} -eq 0 ]; then
         echo "No backups found."
     else
         echo ""
-        echo "Total: ${count} backup(s)"
+        echo "Total: ${count} backup(s), $(numfmt --to=iec "${total_size}" 2>/dev/null || echo "${total_size} bytes")"
     fi
     echo ""
 }
@@ -283,15 +282,11 @@ cmd_backup_schedule() {
     fi
     
     # Read current settings from .env
-    local current_enabled
-    local current_interval
-    local current_retention
-    local current_on_startup
-    
-    current_enabled=$(grep "^BACKUP_ENABLED=" "${ENV_FILE}" 2>/dev/null | cut -d'=' -f2 || echo "true")
-    current_interval=$(grep "^BACKUP_INTERVAL=" "${ENV_FILE}" 2>/dev/null | cut -d'=' -f2 || echo "30")
-    current_retention=$(grep "^BACKUP_RETENTION=" "${ENV_FILE}" 2>/dev/null | cut -d'=' -f2 || echo "48")
-    current_on_startup=$(grep "^BACKUP_ON_STARTUP=" "${ENV_FILE}" 2>/dev/null | cut -d'=' -f2 || echo "false")
+    load_env_values
+    local current_enabled="${ENV_VALUES[BACKUP_ENABLED]:-true}"
+    local current_interval="${ENV_VALUES[BACKUP_INTERVAL]:-30}"
+    local current_retention="${ENV_VALUES[BACKUP_RETENTION]:-48}"
+    local current_on_startup="${ENV_VALUES[BACKUP_ON_STARTUP]:-false}"
     
     # Display current settings
     echo -e "${BOLD}Current Settings:${NC}"
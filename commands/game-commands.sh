@@ -125,9 +125,8 @@ cmd_players() {
     local log_file="/terraria/logs/terraria-stdout.log"
     
     # Get max players from .env file (default to 8 if not set)
-    local max_players
-    max_players=$(grep "^MAX_PLAYERS=" "${ENV_FILE}" 2>/dev/null | cut -d'=' -f2 || echo "8")
-    [ -z "$max_players" ] && max_players="8"
+    load_env_values
+    local max_players="${ENV_VALUES[MAX_PLAYERS]:-8}"
     
     # Use awk to parse player joins/leaves and determine who's online
     # Let awk handle all output formatting to avoid shell processing issues
@@ -31,10 +31,11 @@ cmd_gdrive_sync_setup() {
     fi
 
     # Load current vars
-    local current_remote
-    local current_path
-    current_remote=$(grep "^RCLONE_REMOTE=" "${ENV_FILE}" 2>/dev/null | cut -d'=' -f2 | tr -d '"')
-    current_path=$(grep "^RCLONE_PATH=" "${ENV_FILE}" 2>/dev/null | cut -d'=' -f2 | tr -d '"')
+    load_env_values
+    local current_remote="${ENV_VALUES[RCLONE_REMOTE]:-}"
+    local current_path="${ENV_VALUES[RCLONE_PATH]:-}"
+    current_remote="${current_remote//\"/}"
+    current_path="${current_path//\"/}"
 
     # Prompt for Remote Name
     local default_remote="${current_remote:-TerrariaServerBackup}"
@@ -85,11 +85,11 @@ cmd_restart() {
 cmd_status() {
     print_header "Terraria Server Status"
     
-    # Container status
+    # Container status (one docker ps call answers both running and uptime)
     echo -e "${BOLD}Container:${NC}"
-    if container_running; then
-        local uptime
-        uptime=$(get_container_uptime)
+    local uptime
+    uptime=$(get_container_uptime)
+    if [ -n "${uptime}" ]; then
         print_success "Running (${uptime})"
     else
         print_error "Not running"
@@ -98,20 +98,44 @@ cmd_status() {
     
     echo ""
     
-    # Server process status
+    # One supervisorctl call answers both the server process and services
+    # sections (it exits non-zero whenever any program is not running)
+    local services name state
+    local server_state=""
+    services=$(docker_exec supervisorctl status 2>/dev/null) || true
+    while read -r name state _; do
+        if [ "${name}" = "terraria" ]; then
+            server_state="${state}"
+        fi
+    done <<< "${services}"
+    
+    # Server process status (supervisor reports STARTING for the first
+    # startsecs and STOPPING while the wrapper saves on shutdown; in both
+    # windows TerrariaServer is still up)
     echo -e "${BOLD}Server Process:${NC}"
-    if docker_exec pgrep -f "TerrariaServer" > /dev/null 2>&1; then
-        print_success "Terraria server is running"
-    else
-        print_warning "Terraria server process not found"
-    fi
+    case "${server_state}" in
+        RUNNING)
+            print_success "Terraria server is running"
+            ;;
+        STARTING)
+            print_success "Terraria server is running (starting up)"
+            ;;
+        STOPPING)
+            print_success "Terraria server is running (shutting down)"
+            ;;
+        *)
+            print_warning "Terraria server process not found"
+            ;;
+    esac
     
     # Supervisor status
     echo ""
     echo -e "${BOLD}Services:${NC}"
-    docker_exec supervisorctl status 2>/dev/null | while read -r line; do
-        echo "  $line"
-    done
+    if [ -n "${services}" ]; then
+        while read -r line; do
+            echo "  $line"
+        done <<< "${services}"
+    fi
     
     # Player information (parse from recent logs using awk for Unicode support)
     echo ""
@@ -140,22 +164,19 @@ cmd_status() {
     }
     '
     
-    # World information
+    # World information (one find pass, sorted by name, with the size
+    # column made human-readable in a single numfmt call)
     echo ""
     echo -e "${BOLD}Worlds:${NC}"
     local world_count=0
-    if ls "${DATA_DIR}"/worlds/*.wld 1>/dev/null 2>&1; then
-        for world in "${DATA_DIR}"/worlds/*.wld; do
-            if [ -f "$world" ]; then
-                local name
-                name=$(basename "$world" .wld)
-                local size
-                size=$(du -h "$world" 2>/dev/null | cut -f1)
-                echo "  - ${name} (${size})"
-                ((world_count++)) || true
-            fi
-        done
-    fi
+    local world size
+    while IFS=$'\t' read -r world size; do
+        echo "  - ${world%.wld} (${size})"
+        ((world_count++)) || true
+    done < <(find -L "${DATA_DIR}/worlds" -maxdepth 1 -type f -name '*.wld' \
+                 -printf '%f\t%k\n' 2>/dev/null | \
+             sort -t $'\t' -k1,1 | \
+             numfmt --delimiter=$'\t' --field=2 --from-unit=1024 --to=iec 2>/dev/null)
     if [ ${world_count} -eq 0 ]; then
         echo "  No worlds found"
     fi
@@ -171,13 +192,9 @@ cmd_status() {
     echo "  Size:  ${backup_size:-0}"
     
     # Backup schedule information
-    local backup_enabled
-    backup_enabled=$(grep "^BACKUP_ENABLED=" "${ENV_FILE}" 2>/dev/null | cut -d'=' -f2 || echo "true")
-    [ -z "$backup_enabled" ] && backup_enabled="true"
-    
-    local backup_interval
-    backup_interval=$(grep "^BACKUP_INTERVAL=" "${ENV_FILE}" 2>/dev/null | cut -d'=' -f2 || echo "30")
-    [ -z "$backup_interval" ] && backup_interval="30"
+    load_env_values
+    local backup_enabled="${ENV_VALUES[BACKUP_ENABLED]:-true}"
+    local backup_interval="${ENV_VALUES[BACKUP_INTERVAL]:-30}"
     
     echo ""
     echo -e "${BOLD}Backup Schedule:${NC}"
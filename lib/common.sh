@@ -23,6 +23,9 @@ BACKUP_DIR="${PROJECT_ROOT}/data/backups"
 DATA_DIR="${PROJECT_ROOT}/data"
 COMMAND_FIFO="/tmp/terraria-command.fifo"
 
+# Backup filename format: backup_WORLDNAME_YYYYMMDD_HHMMSS.tar[.gz]
+BACKUP_NAME_RE='^backup_(.+)_([0-9]{8})_([0-9]{6})\.tar(\.gz)?$'
+
 #-------------------------------------------------------------------------------
 # Color Codes
 #-------------------------------------------------------------------------------
@@ -50,3 +53,23 @@ print_success() { print_msg "${GREEN}" "✓ $1"; }
 print_warning() { print_msg "${YELLOW}" "⚠ $1"; }
 print_error()   { print_msg "${RED}" "✗ $1"; }
 print_header()  { echo -e "\n${BOLD}${CYAN}$1${NC}\n"; }
+
+#-------------------------------------------------------------------------------
+# Configuration Functions
+#-------------------------------------------------------------------------------
+
+# Settings read from ENV_FILE by load_env_values
+declare -gA ENV_VALUES=()
+
+# Read every KEY=value line of ENV_FILE in one pass, so commands that need
+# several settings don't grep the file once per key
+load_env_values() {
+    ENV_VALUES=()
+    [ -f "${ENV_FILE}" ] || return 0
+    
+    local key value
+    while IFS='=' read -r key value || [ -n "${key}" ]; do
+        [[ "${key}" =~ ^[A-Za-z_][A-Za-z0-9_]*$ ]] || continue
+        ENV_VALUES["${key}"]="${value}"
+    done < "${ENV_FILE}"
+}
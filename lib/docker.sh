@@ -23,11 +23,11 @@ container_running() {
     sudo docker ps --format '{{.Names}}' | grep -q "^${CONTAINER_NAME}$"
 }
 
-# Get container uptime
+# Get container uptime (prints nothing if the container is not running)
 get_container_uptime() {
-    if container_running; then
-        sudo docker ps --filter "name=${CONTAINER_NAME}" --format '{{.Status}}' | sed 's/Up //'
-    fi
+    local status
+    status=$(sudo docker ps --filter "name=^/?${CONTAINER_NAME}$" --format '{{.Status}}') || true
+    echo "${status#Up }"
 }
 
 #-------------------------------------------------------------------------------
@@ -17,17 +17,22 @@ BACKUP_ON_STARTUP="${BACKUP_ON_STARTUP:-false}"    # Create backup immediately o
 # Export backup settings for backup.sh
 export BACKUP_RETENTION
 
+# Extended patterns are used to strip color codes from relayed output
+shopt -s extglob
+
 #---------------------------------------------------------------
 # Logging helpers
 #---------------------------------------------------------------
 log() {
-    local msg="[$(date '+%Y-%m-%d %H:%M:%S')] [SCHEDULER] $1"
+    local msg
+    printf -v msg '[%(%Y-%m-%d %H:%M:%S)T] [SCHEDULER] %s' -1 "$1"
     echo "$msg"
     echo "$msg" >> "${LOG_FILE}" 2>/dev/null
 }
 
 log_error() {
-    local msg="[$(date '+%Y-%m-%d %H:%M:%S')] [SCHEDULER] [ERROR] $1"
+    local msg
+    printf -v msg '[%(%Y-%m-%d %H:%M:%S)T] [SCHEDULER] [ERROR] %s' -1 "$1"
     echo "$msg" >&2
     echo "$msg" >> "${LOG_FILE}" 2>/dev/null
 }
@@ -48,12 +53,16 @@ trap shutdown_handler SIGTERM SIGINT SIGQUIT
 # Check if server is running and has a world loaded
 #---------------------------------------------------------------
 is_server_active() {
-    # Check if TerrariaServer process exists
-    if pgrep -f "TerrariaServer" > /dev/null 2>&1; then
-        return 0
-    else
-        return 1
-    fi
+    # Check for a TerrariaServer process by name; /proc/<pid>/comm holds the
+    # first 15 characters of the executable name ("TerrariaServer.")
+    local comm_file comm
+    for comm_file in /proc/[0-9]*/comm; do
+        read -r comm 2>/dev/null < "${comm_file}" || continue
+        if [[ "${comm}" == TerrariaServer* ]]; then
+            return 0
+        fi
+    done
+    return 1
 }
 
 #---------------------------------------------------------------
@@ -76,9 +85,10 @@ run_backup() {
     
     log "Starting scheduled backup..."
     
-    # Run the backup script
+    # Run the backup script, relaying its output line by line with the
+    # color codes stripped so the scheduler log stays plain text
     "${BACKUP_SCRIPT}" create 2>&1 | while read -r line; do
-        log "  ${line}"
+        log "  ${line//$'\e'\[*([0-9;])m/}"
     done
     
     local result=${PIPESTATUS[0]}
@@ -13,6 +13,9 @@ LOG_FILE="/terraria/logs/backup.log"
 BACKUP_RETENTION="${BACKUP_RETENTION:-48}"        # Number of backups to keep
 BACKUP_COMPRESSION="${BACKUP_COMPRESSION:-gzip}"  # gzip or none
 
+# Backup filename format: backup_WORLDNAME_YYYYMMDD_HHMMSS.tar[.gz]
+BACKUP_NAME_RE='^backup_(.+)_([0-9]{8})_([0-9]{6})\.tar(\.gz)?$'
+
 # Color codes for output
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -24,25 +27,29 @@ NC='\033[0m' # No Color
 # Logging helpers
 #---------------------------------------------------------------
 log() {
-    local msg="[$(date '+%Y-%m-%d %H:%M:%S')] [BACKUP] $1"
+    local msg
+    printf -v msg '[%(%Y-%m-%d %H:%M:%S)T] [BACKUP] %s' -1 "$1"
     echo -e "$msg"
     echo "$msg" >> "${LOG_FILE}" 2>/dev/null
 }
 
 log_error() {
-    local msg="[$(date '+%Y-%m-%d %H:%M:%S')] [BACKUP] [ERROR] $1"
+    local msg
+    printf -v msg '[%(%Y-%m-%d %H:%M:%S)T] [BACKUP] [ERROR] %s' -1 "$1"
     echo -e "${RED}$msg${NC}" >&2
     echo "$msg" >> "${LOG_FILE}" 2>/dev/null
 }
 
 log_success() {
-    local msg="[$(date '+%Y-%m-%d %H:%M:%S')] [BACKUP] [SUCCESS] $1"
+    local msg
+    printf -v msg '[%(%Y-%m-%d %H:%M:%S)T] [BACKUP] [SUCCESS] %s' -1 "$1"
     echo -e "${GREEN}$msg${NC}"
     echo "$msg" >> "${LOG_FILE}" 2>/dev/null
 }
 
 log_warning() {
-    local msg="[$(date '+%Y-%m-%d %H:%M:%S')] [BACKUP] [WARNING] $1"
+    local msg
+    printf -v msg '[%(%Y-%m-%d %H:%M:%S)T] [BACKUP] [WARNING] %s' -1 "$1"
     echo -e "${YELLOW}$msg${NC}"
     echo "$msg" >> "${LOG_FILE}" 2>/dev/null
 }
@@ -227,25 +234,19 @@ list_backups() {
     printf "%-45s %-12s %-20s\n" "BACKUP FILE" "SIZE" "CREATED"
     printf "%s\n" "--------------------------------------------------------------------------------"
     
-    # Sort by modification time (newest first)
-    for backup in $(ls -t "${BACKUP_DIR}"/backup_*.tar* 2>/dev/null); do
-        if [ -f "$backup" ]; then
-            local name
-            name=$(basename "$backup")
-            local size
-            size=$(du -h "$backup" 2>/dev/null | cut -f1)
-            local size_bytes
-            size_bytes=$(stat -c%s "$backup" 2>/dev/null || echo 0)
-            local created
-            created=$(stat -c '%Y' "$backup" 2>/dev/null)
-            local created_date
-            created_date=$(date -d "@${created}" '+%Y-%m-%d %H:%M' 2>/dev/null || echo "Unknown")
-            
-            printf "%-45s %-12s %-20s\n" "$name" "$size" "$created_date"
-            ((count++))
-            ((total_size += size_bytes))
-        fi
-    done
+    # Single directory pass for mtime, size and disk usage of every backup,
+    # sorted by modification time (newest first) with sizes made human-readable
+    local created size_bytes size name created_date
+    while IFS=$'\t' read -r created size_bytes size name; do
+        printf -v created_date '%(%Y-%m-%d %H:%M)T' "${created%.*}"
+        
+        printf "%-45s %-12s %-20s\n" "$name" "$size" "$created_date"
+        ((count++))
+        ((total_size += size_bytes))
+    done < <(find -L "${BACKUP_DIR}" -maxdepth 1 -type f -name 'backup_*.tar*' \
+                 -printf '%T@\t%s\t%k\t%f\n' 2>/dev/null | \
+             sort -rn | \
+             numfmt --delimiter=$'\t' --field=3 --from-unit=1024 --to=iec 2>/dev/null)
     
     if [ ${count} -eq 0 ]; then
         echo "No backups found."
@@ -275,7 +276,7 @@ show_backup_info() {
     local backup_path
     if [ -f "${backup_file}" ]; then
         backup_path="${backup_file}"
-    elif [ -f "${BACKUP_DIR}/${backup_file}" ]; then
+    elif [[ "${backup_file}" != */* ]] && [ -f "${BACKUP_DIR}/${backup_file}" ]; then
         backup_path="${BACKUP_DIR}/${backup_file}"
     else
         log_error "Backup not found: ${backup_file}"
@@ -352,7 +353,7 @@ verify_backup() {
     local backup_path
     if [ -f "${backup_file}" ]; then
         backup_path="${backup_file}"
-    elif [ -f "${BACKUP_DIR}/${backup_file}" ]; then
+    elif [[ "${backup_file}" != */* ]] && [ -f "${BACKUP_DIR}/${backup_file}" ]; then
         backup_path="${BACKUP_DIR}/${backup_file}"
     else
         log_error "Backup not found: ${backup_file}"
@@ -361,17 +362,20 @@ verify_backup() {
     
     log "Verifying backup: $(basename "${backup_path}")"
     
-    # Test archive integrity
-    local test_result
+    local tar_opts="-tf"
     if [[ "${backup_path}" == *.gz ]]; then
-        test_result=$(tar -tzf "${backup_path}" 2>&1)
-    else
-        test_result=$(tar -tf "${backup_path}" 2>&1)
+        tar_opts="-tzf"
     fi
     
+    # Test archive integrity, streaming the listing into grep rather than
+    # holding it in memory (tar still reads the whole archive)
+    local world_files
+    world_files=$(set -o pipefail
+                  tar "${tar_opts}" "${backup_path}" 2>/dev/null | { grep -c '\.wld' || true; })
+    
     if [ $? -eq 0 ]; then
         # Check for expected files
-        if echo "${test_result}" | grep -q ".wld"; then
+        if [ "${world_files}" -gt 0 ]; then
             log_success "Backup is valid and contains world file(s)"
             return 0
         else
@@ -380,7 +384,7 @@ verify_backup() {
         fi
     else
         log_error "Backup is corrupted or invalid"
-        echo "${test_result}"
+        tar "${tar_opts}" "${backup_path}" 2>&1 >/dev/null
         return 1
     fi
 }
@@ -395,33 +399,41 @@ cleanup_old_backups() {
         return 0
     fi
     
-    # Get list of unique world names from backups
-    local worlds
-    worlds=$(ls "${BACKUP_DIR}"/backup_*.tar* 2>/dev/null | \
-             sed 's/.*backup_\(.*\)_[0-9]*_[0-9]*.tar.*/\1/' | \
-             sort -u)
+    # Scan the backup directory once (newest first) and group by world
+    local backups=()
+    mapfile -t backups < <(ls -t "${BACKUP_DIR}"/backup_*.tar* 2>/dev/null)
+    
+    local -A world_counts=()
+    local -A world_seen=()
+    local backup name world
+    for backup in "${backups[@]}"; do
+        name="${backup##*/}"
+        [[ "${name}" =~ ${BACKUP_NAME_RE} ]] || continue
+        world="${BASH_REMATCH[1]}"
+        world_counts["${world}"]=$(( ${world_counts["${world}"]:-0} + 1 ))
+    done
     
     local deleted_count=0
     
-    for world in ${worlds}; do
-        # Get backups for this world, sorted by date (oldest first)
-        local backups
-        backups=$(ls -t "${BACKUP_DIR}"/backup_${world}_*.tar* 2>/dev/null)
-        local backup_count
-        backup_count=$(echo "${backups}" | wc -w)
+    # Delete each world's backups beyond the retention count (the oldest ones)
+    for backup in "${backups[@]}"; do
+        name="${backup##*/}"
+        [[ "${name}" =~ ${BACKUP_NAME_RE} ]] || continue
+        world="${BASH_REMATCH[1]}"
+        world_seen["${world}"]=$(( ${world_seen["${world}"]:-0} + 1 ))
         
-        if [ "${backup_count}" -gt "${BACKUP_RETENTION}" ]; then
-            local to_delete=$((backup_count - BACKUP_RETENTION))
-            log "World '${world}': ${backup_count} backups, deleting ${to_delete} oldest"
-            
-            # Delete oldest backups (they're at the end since we sorted by -t)
-            echo "${backups}" | tail -n "${to_delete}" | while read -r backup; do
-                if [ -f "${backup}" ]; then
-                    log "Deleting old backup: $(basename "${backup}")"
-                    rm -f "${backup}"
-                    ((deleted_count++))
-                fi
-            done
+        if [ "${world_seen["${world}"]}" -le "${BACKUP_RETENTION}" ]; then
+            continue
+        fi
+        
+        if [ "${world_seen["${world}"]}" -eq $((BACKUP_RETENTION + 1)) ]; then
+            log "World '${world}': ${world_counts["${world}"]} backups, deleting $(( ${world_counts["${world}"]} - BACKUP_RETENTION )) oldest"
+        fi
+        
+        if [ -f "${backup}" ]; then
+            log "Deleting old backup: ${name}"
+            rm -f "${backup}"
+            ((deleted_count++))
         fi
     done
     
@@ -12,7 +12,7 @@ CRASH_LOG="/terraria/logs/crashes.log"
 #---------------------------------------------------------------
 log() {
     local timestamp
-    timestamp=$(date '+%Y-%m-%d %H:%M:%S')
+    printf -v timestamp '%(%Y-%m-%d %H:%M:%S)T' -1
     echo "[${timestamp}] [CRASH-HANDLER] $1" | tee -a "${LOG_FILE}"
 }
 
@@ -61,7 +61,7 @@ handle_event() {
             
             if [ "${expected}" = "0" ]; then
                 log "CRASH DETECTED: Process '${process_name}' exited unexpectedly with code ${exit_status}"
-                echo "[$(date '+%Y-%m-%d %H:%M:%S')] CRASH: ${process_name} exited with code ${exit_status}" >> "${CRASH_LOG}"
+                printf '[%(%Y-%m-%d %H:%M:%S)T] CRASH: %s exited with code %s\n' -1 "${process_name}" "${exit_status}" >> "${CRASH_LOG}"
                 
                 # Could add notification logic here (webhook, email, etc.)
                 # For now, we just log it
@@ -76,7 +76,7 @@ handle_event() {
             process_name=$(echo "${event_data}" | grep -oP 'processname:\K\S+')
             
             log "FATAL: Process '${process_name}' failed to start"
-            echo "[$(date '+%Y-%m-%d %H:%M:%S')] FATAL: ${process_name} failed to start" >> "${CRASH_LOG}"
+            printf '[%(%Y-%m-%d %H:%M:%S)T] FATAL: %s failed to start\n' -1 "${process_name}" >> "${CRASH_LOG}"
             ;;
         
         *)
@@ -99,10 +99,8 @@ main() {
         # Tell supervisor we're ready
         echo "READY"
         
-        # Parse and handle the event
-        read -r event_info
-        event_name=$(echo "${event_info}" | awk '{print $1}')
-        event_data=$(echo "${event_info}" | cut -d' ' -f2-)
+        # Parse and handle the event (read splits off the first field)
+        read -r event_name event_data
         
         handle_event "${event_name}" "${event_data}"
         
@@ -15,11 +15,11 @@ BACKUP_DIR="${BACKUP_DIR:-/terraria/backups}"
 # Logging helper
 #---------------------------------------------------------------
 log() {
-    echo "[$(date '+%Y-%m-%d %H:%M:%S')] [ENTRYPOINT] $1"
+    printf '[%(%Y-%m-%d %H:%M:%S)T] [ENTRYPOINT] %s\n' -1 "$1"
 }
 
 log_error() {
-    echo "[$(date '+%Y-%m-%d %H:%M:%S')] [ENTRYPOINT] [ERROR] $1" >&2
+    printf '[%(%Y-%m-%d %H:%M:%S)T] [ENTRYPOINT] [ERROR] %s\n' -1 "$1" >&2
 }
 
 #---------------------------------------------------------------
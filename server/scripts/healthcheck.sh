@@ -9,6 +9,24 @@
 HEALTHY=true
 ISSUES=""
 
+#---------------------------------------------------------------
+# Check for a process whose command line contains a pattern
+# Reads /proc directly so each health check avoids forking pgrep
+#---------------------------------------------------------------
+process_running() {
+    local pattern="$1"
+    local cmdline args
+    for cmdline in /proc/[0-9]*/cmdline; do
+        # Skip this script, as pgrep skips itself
+        [ "${cmdline}" = "/proc/$$/cmdline" ] && continue
+        mapfile -d '' args 2>/dev/null < "${cmdline}" || continue
+        if [[ "${args[*]}" == *"${pattern}"* ]]; then
+            return 0
+        fi
+    done
+    return 1
+}
+
 #---------------------------------------------------------------
 # Check Supervisor
 #---------------------------------------------------------------
@@ -25,9 +43,15 @@ check_supervisor() {
 # Check Terraria Server Process
 #---------------------------------------------------------------
 check_terraria() {
-    if pgrep -f "TerrariaServer" > /dev/null 2>&1; then
-        return 0
-    fi
+    # /proc/<pid>/comm holds the first 15 characters of the executable
+    # name ("TerrariaServer."), so a name match needs no cmdline reads
+    local comm_file comm
+    for comm_file in /proc/[0-9]*/comm; do
+        read -r comm 2>/dev/null < "${comm_file}" || continue
+        if [[ "${comm}" == TerrariaServer* ]]; then
+            return 0
+        fi
+    done
     return 1
 }
 
@@ -36,7 +60,7 @@ check_terraria() {
 #---------------------------------------------------------------
 check_backup_scheduler() {
     if [ "${BACKUP_ENABLED:-true}" = "true" ]; then
-        if pgrep -f "backup-scheduler.sh" > /dev/null 2>&1; then
+        if process_running "backup-scheduler.sh"; then
             return 0
         fi
         return 1
@@ -8,6 +8,9 @@ WORLD_DIR="${WORLD_DIR:-/terraria/worlds}"
 BACKUP_DIR="${BACKUP_DIR:-/terraria/backups}"
 LOG_FILE="/terraria/logs/restore.log"
 
+# Backup filename format: backup_WORLDNAME_YYYYMMDD_HHMMSS.tar[.gz]
+BACKUP_NAME_RE='^backup_(.+)_([0-9]{8})_([0-9]{6})\.tar(\.gz)?$'
+
 # Color codes for output
 RED='\033[0;31m'
 GREEN='\033[0;32m'
@@ -19,25 +22,29 @@ NC='\033[0m' # No Color
 # Logging helpers
 #---------------------------------------------------------------
 log() {
-    local msg="[$(date '+%Y-%m-%d %H:%M:%S')] [RESTORE] $1"
+    local msg
+    printf -v msg '[%(%Y-%m-%d %H:%M:%S)T] [RESTORE] %s' -1 "$1"
     echo -e "$msg"
     echo "$msg" >> "${LOG_FILE}" 2>/dev/null
 }
 
 log_error() {
-    local msg="[$(date '+%Y-%m-%d %H:%M:%S')] [RESTORE] [ERROR] $1"
+    local msg
+    printf -v msg '[%(%Y-%m-%d %H:%M:%S)T] [RESTORE] [ERROR] %s' -1 "$1"
     echo -e "${RED}$msg${NC}" >&2
     echo "$msg" >> "${LOG_FILE}" 2>/dev/null
 }
 
 log_success() {
-    local msg="[$(date '+%Y-%m-%d %H:%M:%S')] [RESTORE] [SUCCESS] $1"
+    local msg
+    printf -v msg '[%(%Y-%m-%d %H:%M:%S)T] [RESTORE] [SUCCESS] %s' -1 "$1"
     echo -e "${GREEN}$msg${NC}"
     echo "$msg" >> "${LOG_FILE}" 2>/dev/null
 }
 
 log_warning() {
-    local msg="[$(date '+%Y-%m-%d %H:%M:%S')] [RESTORE] [WARNING] $1"
+    local msg
+    printf -v msg '[%(%Y-%m-%d %H:%M:%S)T] [RESTORE] [WARNING] %s' -1 "$1"
     echo -e "${YELLOW}$msg${NC}"
     echo "$msg" >> "${LOG_FILE}" 2>/dev/null
 }
@@ -79,11 +86,16 @@ usage() {
 # Check if server is running
 #---------------------------------------------------------------
 is_server_running() {
-    if pgrep -f "TerrariaServer" > /dev/null 2>&1; then
-        return 0
-    else
-        return 1
-    fi
+    # /proc/<pid>/comm holds the first 15 characters of the executable
+    # name ("TerrariaServer."), so a name match needs no pgrep fork
+    local comm_file comm
+    for comm_file in /proc/[0-9]*/comm; do
+        read -r comm 2>/dev/null < "${comm_file}" || continue
+        if [[ "${comm}" == TerrariaServer* ]]; then
+            return 0
+        fi
+    done
+    return 1
 }
 
 #---------------------------------------------------------------
@@ -94,7 +106,7 @@ get_backup_path() {
     
     if [ -f "${backup_file}" ]; then
         echo "${backup_file}"
-    elif [ -f "${BACKUP_DIR}/${backup_file}" ]; then
+    elif [[ "${backup_file}" != */* ]] && [ -f "${BACKUP_DIR}/${backup_file}" ]; then
         echo "${BACKUP_DIR}/${backup_file}"
     else
         echo ""
@@ -106,11 +118,14 @@ get_backup_path() {
 #---------------------------------------------------------------
 get_world_name_from_backup() {
     local backup_file="$1"
-    local basename
-    basename=$(basename "${backup_file}")
+    local backup_name="${backup_file##*/}"
     
     # Format: backup_WORLDNAME_YYYYMMDD_HHMMSS.tar.gz
-    echo "${basename}" | sed 's/^backup_\(.*\)_[0-9]*_[0-9]*.tar.*/\1/'
+    if [[ "${backup_name}" =~ ${BACKUP_NAME_RE} ]]; then
+        echo "${BASH_REMATCH[1]}"
+    else
+        echo "${backup_name}"
+    fi
 }
 
 #---------------------------------------------------------------
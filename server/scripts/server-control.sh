@@ -36,6 +36,41 @@ print_info() {
     echo -e "${BLUE}[INFO]${NC} $1"
 }
 
+# Check for a process whose command line contains a pattern (reads /proc
+# directly instead of forking pgrep)
+process_running() {
+    local pattern="$1"
+    local cmdline args
+    for cmdline in /proc/[0-9]*/cmdline; do
+        # Skip this script, as pgrep skips itself
+        [ "${cmdline}" = "/proc/$$/cmdline" ] && continue
+        mapfile -d '' args 2>/dev/null < "${cmdline}" || continue
+        if [[ "${args[*]}" == *"${pattern}"* ]]; then
+            return 0
+        fi
+    done
+    return 1
+}
+
+# List Terraria server processes as "PID command line", like pgrep -a.
+# Matches on /proc/<pid>/comm, which holds the first 15 characters of the
+# executable name ("TerrariaServer."). With -q, stop at the first match
+# without printing.
+terraria_processes() {
+    local quiet="$1"
+    local found=1
+    local pid_dir comm args
+    for pid_dir in /proc/[0-9]*; do
+        read -r comm 2>/dev/null < "${pid_dir}/comm" || continue
+        [[ "${comm}" == TerrariaServer* ]] || continue
+        [ "${quiet}" = "-q" ] && return 0
+        found=0
+        mapfile -d '' args 2>/dev/null < "${pid_dir}/cmdline" || continue
+        echo "${pid_dir#/proc/} ${args[*]}"
+    done
+    return ${found}
+}
+
 #---------------------------------------------------------------
 # Check if Supervisor is running
 #---------------------------------------------------------------
@@ -57,9 +92,10 @@ cmd_status() {
     supervisorctl status
     echo ""
     echo "=== Server Process ==="
-    if pgrep -f "TerrariaServer" > /dev/null; then
+    local server_procs
+    if server_procs=$(terraria_processes); then
         print_status "Terraria server is running"
-        pgrep -af "TerrariaServer"
+        echo "${server_procs}"
     else
         print_warning "Terraria server is NOT running"
     fi
@@ -99,9 +135,9 @@ cmd_logs() {
             tail -n "${lines}" /terraria/logs/terraria-stderr.log
             ;;
         crash)
-            print_info "Showing crash log..."
+            print_info "Showing last ${lines} lines of crash log..."
             if [ -f /terraria/logs/crashes.log ]; then
-                cat /terraria/logs/crashes.log
+                tail -n "${lines}" /terraria/logs/crashes.log
             else
                 print_info "No crashes recorded."
             fi
@@ -236,14 +272,14 @@ cmd_health() {
     fi
     
     # Check Terraria process
-    if pgrep -f "TerrariaServer" > /dev/null; then
+    if terraria_processes -q; then
         print_status "Terraria server: Running"
     else
         print_error "Terraria server: Not running"
     fi
     
     # Check backup scheduler
-    if pgrep -f "backup-scheduler" > /dev/null; then
+    if process_running "backup-scheduler"; then
         print_status "Backup scheduler: Running"
     else
         if [ "${BACKUP_ENABLED:-true}" = "true" ]; then
@@ -253,8 +289,10 @@ cmd_health() {
         fi
     fi
     
-    # Check disk space
-    local free_mb=$(df -m /terraria/worlds | awk 'NR==2 {print $4}')
+    # Check disk space (statfs fields via stat -f, rounded up to MB like df -m)
+    local avail_blocks block_size
+    read -r avail_blocks block_size < <(stat -f -c '%a %S' /terraria/worlds)
+    local free_mb=$(( (avail_blocks * block_size + 1048575) / 1048576 ))
     if [ "${free_mb}" -gt 500 ]; then
         print_status "Disk space: ${free_mb}MB free"
     elif [ "${free_mb}" -gt 100 ]; then
@@ -263,14 +301,21 @@ cmd_health() {
         print_error "Disk space: ${free_mb}MB free (CRITICAL)"
     fi
     
-    # Check log sizes
-    local log_size=$(du -sm /terraria/logs 2>/dev/null | cut -f1)
+    # Check log and backup sizes (one du call covers both directories)
+    local log_size="" backup_size="" size dir
+    while read -r size dir; do
+        case "${dir}" in
+            /terraria/logs) log_size="${size}" ;;
+            /terraria/backups) backup_size="${size}" ;;
+        esac
+    done < <(du -sm /terraria/logs /terraria/backups 2>/dev/null)
     print_info "Log directory size: ${log_size:-0}MB"
     
-    # Check backup sizes
-    local backup_count=$(ls /terraria/backups/backup_*.tar* 2>/dev/null | wc -l)
-    local backup_size=$(du -sm /terraria/backups 2>/dev/null | cut -f1)
-    print_info "Backups: ${backup_count} files, ${backup_size:-0}MB total"
+    # Count backups with a glob rather than ls | wc
+    shopt -s nullglob
+    local backups=(/terraria/backups/backup_*.tar*)
+    shopt -u nullglob
+    print_info "Backups: ${#backups[@]} files, ${backup_size:-0}MB total"
     
     # Show uptime
     if [ -f /terraria/logs/terraria-stdout.log ]; then
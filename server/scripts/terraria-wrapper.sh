@@ -24,11 +24,11 @@ current_delay=${RESTART_DELAY}
 # Logging helper
 #---------------------------------------------------------------
 log() {
-    echo "[$(date '+%Y-%m-%d %H:%M:%S')] [WRAPPER] $1"
+    printf '[%(%Y-%m-%d %H:%M:%S)T] [WRAPPER] %s\n' -1 "$1"
 }
 
 log_error() {
-    echo "[$(date '+%Y-%m-%d %H:%M:%S')] [WRAPPER] [ERROR] $1" >&2
+    printf '[%(%Y-%m-%d %H:%M:%S)T] [WRAPPER] [ERROR] %s\n' -1 "$1" >&2
 }
 
 #---------------------------------------------------------------
@@ -171,9 +171,11 @@ preflight_checks() {
     # Create necessary directories
     mkdir -p "${LOG_DIR}" "${WORLD_DIR}"
     
-    # Check disk space (warn if less than 100MB free)
-    local free_space
-    free_space=$(df -m /terraria/worlds | awk 'NR==2 {print $4}')
+    # Check disk space (warn if less than 100MB free); statfs fields via
+    # stat -f, rounded up to MB like df -m
+    local avail_blocks block_size
+    read -r avail_blocks block_size < <(stat -f -c '%a %S' /terraria/worlds)
+    local free_space=$(( (avail_blocks * block_size + 1048575) / 1048576 ))
     if [ "${free_space}" -lt 100 ]; then
         log "WARNING: Low disk space (${free_space}MB free)"
     fi
@@ -19,13 +19,15 @@ NC='\033[0m' # No Color
 # Logging helpers
 #---------------------------------------------------------------
 log() {
-    local msg="[$(date '+%Y-%m-%d %H:%M:%S')] [WORLD-MANAGER] $1"
+    local msg
+    printf -v msg '[%(%Y-%m-%d %H:%M:%S)T] [WORLD-MANAGER] %s' -1 "$1"
     echo -e "$msg"
     echo "$msg" >> "${LOG_FILE}" 2>/dev/null
 }
 
 log_error() {
-    local msg="[$(date '+%Y-%m-%d %H:%M:%S')] [WORLD-MANAGER] [ERROR] $1"
+    local msg
+    printf -v msg '[%(%Y-%m-%d %H:%M:%S)T] [WORLD-MANAGER] [ERROR] %s' -1 "$1"
     echo -e "${RED}$msg${NC}" >&2
     echo "$msg" >> "${LOG_FILE}" 2>/dev/null
 }
@@ -88,26 +90,19 @@ list_worlds() {
     printf "%-30s %-12s %-20s\n" "NAME" "SIZE" "LAST MODIFIED"
     printf "%s\n" "--------------------------------------------------------------"
     
-    shopt -s nullglob 2>/dev/null || true
-    for world in "${WORLD_DIR}"/*.wld; do
-        if [ -f "$world" ]; then
-            local name
-            name=$(basename "$world" .wld)
-            local size
-            size=$(du -h "$world" 2>/dev/null | cut -f1)
-            local size_bytes
-            size_bytes=$(stat -c%s "$world" 2>/dev/null || echo 0)
-            local modified
-            modified=$(stat -c '%Y' "$world" 2>/dev/null)
-            local modified_date
-            modified_date=$(date -d "@${modified}" '+%Y-%m-%d %H:%M' 2>/dev/null || echo "Unknown")
-            
-            printf "%-30s %-12s %-20s\n" "$name" "$size" "$modified_date"
-            ((count++))
-            ((total_size += size_bytes))
-        fi
-    done
-    shopt -u nullglob 2>/dev/null || true
+    # Single directory pass for size, disk usage and mtime of every world,
+    # sorted by name with sizes made human-readable
+    local name size_bytes size modified modified_date
+    while IFS=$'\t' read -r name size_bytes size modified; do
+        printf -v modified_date '%(%Y-%m-%d %H:%M)T' "${modified%.*}"
+        
+        printf "%-30s %-12s %-20s\n" "${name%.wld}" "$size" "$modified_date"
+        ((count++))
+        ((total_size += size_bytes))
+    done < <(find -L "${WORLD_DIR}" -maxdepth 1 -type f -name '*.wld' \
+                 -printf '%f\t%s\t%k\t%T@\n' 2>/dev/null | \
+             sort -t $'\t' -k1,1 | \
+             numfmt --delimiter=$'\t' --field=3 --from-unit=1024 --to=iec 2>/dev/null)
     
     if [ ${count} -eq 0 ]; then
         echo "No worlds found."
@@ -144,35 +139,31 @@ show_world_info() {
     echo "================================="
     echo ""
     
-    # Basic file info
+    # Basic file info (one stat call for size, disk usage and timestamps;
+    # --cached=always lets statx answer from cached attributes without a sync)
+    local size_bytes blocks block_size created modified
+    read -r size_bytes blocks block_size created modified < <(stat --cached=always -c '%s %b %B %W %Y' "${world_file}")
     local size
-    size=$(du -h "${world_file}" | cut -f1)
-    local size_bytes
-    size_bytes=$(stat -c%s "${world_file}")
-    local created
-    created=$(stat -c '%W' "${world_file}" 2>/dev/null)
-    local modified
-    modified=$(stat -c '%Y' "${world_file}")
+    size=$(numfmt --to=iec $((blocks * block_size)))
     
     echo "File:          ${world_file}"
     echo "Size:          ${size} (${size_bytes} bytes)"
-    echo "Modified:      $(date -d "@${modified}" '+%Y-%m-%d %H:%M:%S')"
+    printf 'Modified:      %(%Y-%m-%d %H:%M:%S)T\n' "${modified}"
     
     if [ "${created}" != "0" ] && [ "${created}" != "-" ]; then
-        echo "Created:       $(date -d "@${created}" '+%Y-%m-%d %H:%M:%S')"
+        printf 'Created:       %(%Y-%m-%d %H:%M:%S)T\n' "${created}"
     fi
     
-    # Check for backup file
+    # Check for backup file (one stat call; it fails when there is none)
     local bak_file="${world_file}.bak"
-    if [ -f "${bak_file}" ]; then
+    local bak_blocks bak_block_size bak_modified
+    if read -r bak_blocks bak_block_size bak_modified < <(stat --cached=always -c '%b %B %Y' "${bak_file}" 2>/dev/null); then
         local bak_size
-        bak_size=$(du -h "${bak_file}" | cut -f1)
-        local bak_modified
-        bak_modified=$(stat -c '%Y' "${bak_file}")
+        bak_size=$(numfmt --to=iec $((bak_blocks * bak_block_size)))
         echo ""
         echo "Backup file:   ${bak_file}"
         echo "Backup size:   ${bak_size}"
-        echo "Backup date:   $(date -d "@${bak_modified}" '+%Y-%m-%d %H:%M:%S')"
+        printf 'Backup date:   %(%Y-%m-%d %H:%M:%S)T\n' "${bak_modified}"
     fi
     
     echo ""
@@ -199,7 +190,7 @@ create_world_interactive() {
     fi
     
     # Sanitize world name (remove special characters)
-    world_name=$(echo "${world_name}" | tr -cd '[:alnum:]_-')
+    world_name="${world_name//[^A-Za-z0-9_-]/}"
     
     # Check if world exists
     if [ -f "${WORLD_DIR}/${world_name}.wld" ]; then
@@ -411,7 +402,7 @@ copy_world() {
     fi
     
     # Sanitize destination name
-    dst_name=$(echo "${dst_name}" | tr -cd '[:alnum:]_-')
+    dst_name="${dst_name//[^A-Za-z0-9_-]/}"
     
     local src_file="${WORLD_DIR}/${src_name}.wld"
     local dst_file="${WORLD_DIR}/${dst_name}.wld"